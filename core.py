@@ -1,26 +1,164 @@
 import os
 import platform
+import re
 import shutil
-from pathlib import Path
-from typing import Dict, List, Set, Tuple
+import subprocess
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path, PureWindowsPath
+from typing import Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import config
 
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_LINUX = _SYSTEM == "Linux"
+
+# Steam launch URLs used by desktop shortcuts, capturing the app id
+_STEAM_URL_RE = re.compile(r"steam://(?:rungameid|run)/(\d+)")
+
+# Worker threads used to apply icons to games, tunable through ICONPACK_THREADS
+_THREADS_ENV = os.environ.get("ICONPACK_THREADS", "")
+# isdecimal(), unlike isdigit(), only accepts characters int() can parse (no superscripts)
+_APPLY_WORKERS = int(_THREADS_ENV) if _THREADS_ENV.isdecimal() and int(_THREADS_ENV) > 0 else 8
+
+# Game ids the default style (style 1) has no icons for
+_STYLE1_EXCLUDED = frozenset((6, 7))
+
+# Lines edited in desktop shortcuts
+_WIN_ICON_RE = re.compile(r'^IconFile=(.*)$', re.M)
+_URL_LINE_RE = re.compile(r'^URL=.*$', re.M)
+_LINUX_ICON_RE = re.compile(r'^Icon=(.*)$', re.M)
+_DESKTOP_ENTRY_RE = re.compile(r'^[ \t]*\[Desktop Entry\][ \t]*$', re.M)
+_SECTION_RE = re.compile(r'^\[', re.M)
+_EXEC_LINE_RE = re.compile(r'^Exec=.*$', re.M)
+
+# Extensions Steam uses for library cache images
+_JPG_EXTS = frozenset(('jpg', 'jpeg'))
+
+# Desktop shortcut extensions, as tuples for str.endswith
+_WIN_SHORTCUT_EXTS = ('.url',)
+_NIX_SHORTCUT_EXTS = ('.desktop',)
+
+# Real .url/.desktop files are a few KiB; anything bigger isn't a shortcut worth reading
+_MAX_SHORTCUT_SIZE = 64 * 1024
+
+# The platform can't change at runtime, so resolve platform-specific values once
+_SHORTCUT_EXTS = _WIN_SHORTCUT_EXTS if _IS_WINDOWS else _NIX_SHORTCUT_EXTS
+_PUBLIC_DESKTOP = Path(os.environ.get('PUBLIC', '')) / "Desktop" if _IS_WINDOWS else None
+
+
+def _file_ext(name: str) -> str:
+    """Get the lowercased extension of a file name, without the dot"""
+    # Same result as Path.suffix, without building a Path
+    stem, _, ext = name.rpartition('.')
+    return ext.lower() if stem else ""
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Replace the contents of a text file atomically, keeping its permissions"""
+    # Write next to the real file (not a symlink) so the final rename replaces it in one step
+    target = Path(os.path.realpath(path))
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # Shortcuts may need their executable bit to stay trusted by the desktop
+        shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _zero_copy(src: Path, dest: Path) -> None:
+    """Copy file contents from src to dest in kernel space, skipping metadata"""
+    if _IS_WINDOWS:
+        import ctypes
+
+        # CopyFile2 lets the OS offload the copy (block cloning, server-side copy)
+        hr = ctypes.windll.kernel32.CopyFile2(str(src), str(dest), None)
+        if hr != 0:
+            raise ctypes.WinError(hr & 0xFFFF)
+        return
+
+    if not _IS_LINUX:
+        # sendfile() only accepts regular file destinations on Linux
+        shutil.copyfile(src, dest)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dest_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            offset = 0
+            while True:
+                sent = os.sendfile(dest_fd, src_fd, offset, 2 ** 30)
+                if sent == 0:
+                    break
+                offset += sent
+        finally:
+            os.close(dest_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_if_changed(src: str, dest: str) -> None:
+    """Copy src to dest unless dest already has the same size and modification time"""
+    src_stat = os.stat(src)
+    try:
+        dest_stat = os.stat(dest)
+        if dest_stat.st_size == src_stat.st_size and int(dest_stat.st_mtime) == int(src_stat.st_mtime):
+            return
+    except FileNotFoundError:
+        pass
+
+    _zero_copy(src, dest)
+    # Keep the source timestamps so the next extraction can skip this file
+    os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _link_if_changed(src: str, dest: str) -> None:
+    """Hard-link dest to src, replacing any different file, falling back to a copy"""
+    # Linked files share one inode, so editing dest in place also edits src
+    try:
+        if os.path.samefile(src, dest):
+            return
+        os.unlink(dest)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(src, dest)
+    except OSError:
+        # Filesystems without hard link support (FAT, some network shares)
+        _copy_if_changed(src, dest)
+
 
 class IconInstallerModel:
     def __init__(self):
         self.current_style = 1
         self.styles = config.STYLES
+        # Styles may be plain names or (name, description) tuples
+        self._styles_info: Tuple[Tuple[str, str], ...] = tuple(
+            (style[0], style[1]) if isinstance(style, tuple) else (style, "")
+            for style in self.styles
+        )
         self.game_mapping = config.GAME_MAPPING
+        self._style_index: Dict[Path, Dict[str, List[Path]]] = {}
+
+        # Games available for each style (1-based)
+        all_games = frozenset(self.game_mapping)
+        self._style_available: Dict[int, FrozenSet[int]] = {
+            idx: all_games - _STYLE1_EXCLUDED if idx == 1 else all_games
+            for idx in range(1, len(self.styles) + 1)
+        }
 
     def get_style_info(self, index: int) -> Tuple[str, str]:
         """Get style name and description for a given index (1-based)"""
-        if 1 <= index <= len(self.styles):
-            style = self.styles[index - 1]
-            if isinstance(style, tuple):
-                return style[0], style[1]
-            else:
-                return style, ""
+        if 1 <= index <= len(self._styles_info):
+            return self._styles_info[index - 1]
         return "", ""
 
     def get_style_name(self, index: int) -> str:
@@ -28,25 +166,49 @@ class IconInstallerModel:
         name, _ = self.get_style_info(index)
         return name
 
-    def get_available_games(self):
-        return [k for k in self.game_mapping
-                if not (self.current_style == 1 and k in [6, 7])]
-
-    @staticmethod
-    def find_icon_files(game_name: str, style_dir: Path) -> List[Path]:
+    def get_available_games(self, style: Optional[int] = None) -> FrozenSet[int]:
+        """Get the ids of the games available for a style (the current one by default)"""
+        if style is None:
+            style = self.current_style
+        return self._style_available.get(style, frozenset(self.game_mapping))
+
+    def index_style_dir(self, style_dir: Path) -> Dict[str, List[Path]]:
+        """Group the icon files of a style directory by normcased file stem (game name)"""
+        # Each style directory is only listed once
+        icon_map = self._style_index.get(style_dir)
+        if icon_map is None:
+            icon_map = {}
+            with os.scandir(style_dir) as it:
+                for entry in it:
+                    stem, _, ext = entry.name.rpartition('.')
+                    if stem and ext and entry.is_file():
+                        # Windows file names are case-insensitive, so key them like glob() would match
+                        icon_map.setdefault(os.path.normcase(stem), []).append(Path(entry.path))
+            self._style_index[style_dir] = icon_map
+        return icon_map
+
+    def find_icon_files(self, game_name: str, style_dir: Path) -> List[Path]:
         """Find all icon files for a game name in the given style directory"""
-        icon_files = []
-        for file in style_dir.glob(f"{game_name}.*"):
-            if file.is_file():
-                icon_files.append(file)
-        return icon_files
+        return self.index_style_dir(style_dir).get(os.path.normcase(game_name), [])
 
     @staticmethod
     def find_target_files(target_dir: Path, extensions: Set[str]) -> List[Path]:
-        """Find all files in target directory matching any of the given extensions"""
+        """Find the first file in target directory for each of the given extensions"""
+        remaining = {ext.lower() for ext in extensions}
         target_files: List[Path] = []
-        for ext in extensions:
-            target_files.extend(target_dir.glob(f"*.{ext}"))
+        try:
+            with os.scandir(target_dir) as it:
+                for entry in it:
+                    ext = _file_ext(entry.name)
+                    if ext in remaining and entry.is_file():
+                        target_files.append(Path(entry.path))
+                        remaining.discard(ext)
+                        # Stop reading the directory once every extension has a target
+                        if not remaining:
+                            break
+        except OSError:
+            # Unreadable or just removed folders have no targets, like glob() used to report
+            return []
         return target_files
 
     @staticmethod
@@ -54,32 +216,31 @@ class IconInstallerModel:
         """Match icon files to target files by extension"""
         pairs = []
 
-        # Create a mapping of extensions to target files
-        ext_to_targets: Dict[str, List[Path]] = {}
-        for target in target_files:
-            ext = target.suffix.lower().lstrip('.')
-            if ext not in ext_to_targets:
-                ext_to_targets[ext] = []
-            ext_to_targets[ext].append(target)
-
-        # Match icon files to targets by extension
+        # Index the (few) icon files by extension
+        icons_by_ext: Dict[str, Deque[Path]] = defaultdict(deque)
         for icon_file in icon_files:
-            icon_ext = icon_file.suffix.lower().lstrip('.')
-            if icon_ext in ext_to_targets and ext_to_targets[icon_ext]:
-                # Use the first matching target file
-                target = ext_to_targets[icon_ext][0]
-                pairs.append((icon_file, target))
-                # Remove the used target to avoid duplicates
-                ext_to_targets[icon_ext].remove(target)
+            icons_by_ext[_file_ext(icon_file.name)].append(icon_file)
+
+        # Walk the target files once, giving each the next unused icon of its extension
+        remaining = len(icon_files)
+        for target in target_files:
+            bucket = icons_by_ext.get(_file_ext(target.name))
+            if bucket:
+                pairs.append((bucket.popleft(), target))
+                remaining -= 1
+                if not remaining:
+                    break
 
         return pairs
 
 
 class IconExtractor:
     @staticmethod
-    def extract_icons(base_path: Path, destination_path: Path) -> Tuple[bool, str, int]:
+    def extract_icons(base_path: Path, destination_path: Path, hardlink: bool = False) -> Tuple[bool, str, int]:
         """
         Extract icons from the base path to destination path
+        With hardlink set, extracted files are hard links sharing data with the source, not copies
+        (same filesystem only); only use it when the source is a throwaway copy
         Returns: (success, message, file_count)
         """
         try:
@@ -90,122 +251,194 @@ class IconExtractor:
             if not icons_source.exists():
                 return False, "Icons folder not found!", 0
 
-            # Remove existing destination if it exists
-            if icons_dest.exists():
-                shutil.rmtree(icons_dest)
-
-            # Copy the entire icons folder
-            shutil.copytree(icons_source, icons_dest)
-
-            # Count total files extracted
-            file_count = sum(1 for _ in icons_dest.rglob('*') if _.is_file())
+            # Recreate the folder structure over any existing one, then copy changed files in parallel
+            srcs: List[str] = []
+            dests: List[str] = []
+            IconExtractor._collect_files(str(icons_source), str(icons_dest), srcs, dests)
+
+            robocopy = shutil.which("robocopy") if _IS_WINDOWS and not hardlink else None
+            if robocopy:
+                # robocopy's multithreaded copy is much faster for many small files on Windows
+                result = subprocess.run(
+                    [robocopy, str(icons_source), str(icons_dest), "/E", "/MT:16",
+                     "/NFL", "/NDL", "/NJH", "/NJS"],
+                    capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW
+                )
+                # Exit codes below 8 mean success
+                if result.returncode >= 8:
+                    raise OSError(f"robocopy exited with code {result.returncode}")
+                file_count = len(srcs)
+            else:
+                place_file = _link_if_changed if hardlink else _copy_if_changed
+                with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as executor:
+                    file_count = sum(1 for _ in executor.map(place_file, srcs, dests))
 
             return True, f"Icons extracted! ({file_count} files)", file_count
 
         except Exception as e:
             return False, f"Extract failed: {e}", 0
 
+    @staticmethod
+    def _collect_files(src_dir: str, dest_dir: str, srcs: List[str], dests: List[str]) -> None:
+        """Create dest_dir mirroring src_dir and collect the file pairs to copy"""
+        # Walk with an explicit stack so deep trees don't hit the recursion limit
+        stack = [(src_dir, dest_dir)]
+        while stack:
+            src, dest = stack.pop()
+            os.makedirs(dest, exist_ok=True)
+            with os.scandir(src) as it:
+                for entry in it:
+                    target = os.path.join(dest, entry.name)
+                    if entry.is_dir():
+                        stack.append((entry.path, target))
+                    elif entry.is_file():
+                        srcs.append(entry.path)
+                        dests.append(target)
+
 
 class IconApplier:
     def __init__(self, model: IconInstallerModel, base_path: Path, common_path: Path):
         self.model = model
         self.base_path = base_path
         self.common_path = common_path
+        # Fixed for the applier's lifetime, so join them once
+        self.icons_root = base_path / "icons"
+        self.library_cache_root = common_path / "appcache" / "librarycache"
 
     def apply_icons_to_games(self, selected_games: Set[int]) -> List[Tuple[str, bool, str]]:
         """
         Apply icons to selected games
         Returns: List of (game_name, success, message) tuples
         """
-        results = []
+        # Desktop shortcuts are shared by all games, so read them only once
+        shortcuts_by_appid, desktop_errors = self._index_desktop_shortcuts()
 
-        for game_id in selected_games:
-            name, target_rel, appid = self.model.game_mapping[game_id]
-            target_dir = self.common_path / target_rel
-            style_dir = self.base_path / "icons" / f"style{self.model.current_style}"
+        # The style folder is the same for every game, so list it only once
+        style_dir = self.icons_root / f"style{self.model.current_style}"
+        icon_map = self.model.index_style_dir(style_dir) if style_dir.is_dir() else None
 
-            if not target_dir.is_dir():
-                results.append((name, False, f"{name} folder missing. Skipping."))
-                continue
+        # Games are independent and I/O bound, so apply them concurrently
+        games = list(selected_games)
+        if not games:
+            return []
 
-            if not style_dir.is_dir():
-                results.append((name, False, "Style folder missing. Skipping."))
-                continue
+        results: List[Tuple[str, bool, str]] = []
+        with ThreadPoolExecutor(max_workers=min(_APPLY_WORKERS, len(games))) as executor:
+            # map() keeps the results in selection order
+            for game_results in executor.map(self._apply_to_game, games, repeat(icon_map),
+                                             repeat(shortcuts_by_appid), repeat(desktop_errors)):
+                results.extend(game_results)
 
-            # Find all icon files for this game
-            icon_files = self.model.find_icon_files(name, style_dir)
-            if not icon_files:
-                results.append((name, False, f"No icon files found for {name}. Skipping."))
-                continue
+        return results
 
-            # Get unique extensions from icon files
-            icon_extensions = {f.suffix.lower().lstrip('.') for f in icon_files}
+    def _apply_to_game(self, game_id: int, icon_map: Optional[Dict[str, List[Path]]],
+                       shortcuts_by_appid: Dict[int, List[Tuple[Path, str]]],
+                       desktop_errors: List[OSError]) -> List[Tuple[str, bool, str]]:
+        """
+        Apply icons to a single game, reporting unexpected errors as a failed result
+        Returns: List of (game_name, success, message) tuples
+        """
+        name = self.model.game_mapping[game_id][0] if game_id in self.model.game_mapping else str(game_id)
+        try:
+            return self._apply_game_icons(game_id, icon_map, shortcuts_by_appid, desktop_errors)
+        except Exception as e:
+            # An exception escaping a pool worker would discard every other game's results
+            return [(name, False, f"Failed to apply icons for {name}: {e}")]
 
-            # Find matching target files
-            target_files = self.model.find_target_files(target_dir, icon_extensions)
-            if not target_files:
-                results.append((name, False, f"No matching target files found for {name}. Skipping."))
-                continue
+    def _apply_game_icons(self, game_id: int, icon_map: Optional[Dict[str, List[Path]]],
+                          shortcuts_by_appid: Dict[int, List[Tuple[Path, str]]],
+                          desktop_errors: List[OSError]) -> List[Tuple[str, bool, str]]:
+        """
+        Apply icons to a single game
+        Returns: List of (game_name, success, message) tuples
+        """
+        name, target_rel, appid = self.model.game_mapping[game_id]
+        target_dir = self.common_path / target_rel
 
-            # Get matching pairs
-            matching_pairs = self.model.get_matching_pairs(icon_files, target_files)
-            if not matching_pairs:
-                results.append((name, False, f"No matching file pairs found for {name}. Skipping."))
-                continue
+        if not target_dir.is_dir():
+            return [(name, False, f"{name} folder missing. Skipping.")]
 
-            # Apply all matching icons
-            applied_count = 0
-            applied_files = {}  # Track which files were successfully applied
-            for src, dest in matching_pairs:
-                try:
-                    shutil.copy(src, dest)
-                    applied_count += 1
-                    # Store the destination file path by extension
-                    ext = dest.suffix.lower().lstrip('.')
-                    applied_files[ext] = dest
-                except Exception as e:
-                    results.append((name, False, f"Failed to copy {src.name} to {dest.name}: {e}"))
-                    continue
+        if icon_map is None:
+            return [(name, False, "Style folder missing. Skipping.")]
 
-            if applied_count > 0:
-                results.append((name, True, f"{name}: Applied {applied_count} icon(s)!"))
+        # Find all icon files for this game
+        icon_files = icon_map.get(os.path.normcase(name), [])
+        if not icon_files:
+            return [(name, False, f"No icon files found for {name}. Skipping.")]
 
-                # Update library cache
-                try:
-                    lib_result = self._update_library_cache(appid, icon_files)
-                    if lib_result:
-                        results.append((name, True, f"{name} library icon applied!"))
-                except Exception as e:
-                    results.append((name, False, f"Failed library icon for {name}: {e}"))
+        # Get unique extensions from icon files
+        icon_extensions = {_file_ext(f.name) for f in icon_files}
 
-                # Update desktop shortcuts
-                try:
-                    shortcuts_count = self._update_desktop_shortcuts(appid, applied_files)
-                    if shortcuts_count > 0:
-                        results.append((name, True, f"{name}: Updated {shortcuts_count} desktop shortcut(s)!"))
-                except Exception as e:
-                    results.append((name, False, f"Failed desktop shortcuts for {name}: {e}"))
+        # Find matching target files
+        target_files = self.model.find_target_files(target_dir, icon_extensions)
+        if not target_files:
+            return [(name, False, f"No matching target files found for {name}. Skipping.")]
+
+        # Get matching pairs
+        matching_pairs = self.model.get_matching_pairs(icon_files, target_files)
+        if not matching_pairs:
+            return [(name, False, f"No matching file pairs found for {name}. Skipping.")]
+
+        # Apply all matching icons
+        results = []
+        applied_count = 0
+        applied_files = {}  # Track which files were successfully applied
+        for src, dest in matching_pairs:
+            try:
+                _zero_copy(src, dest)
+                applied_count += 1
+                # Store the destination file path by extension
+                applied_files[_file_ext(dest.name)] = dest
+            except Exception as e:
+                results.append((name, False, f"Failed to copy {src.name} to {dest.name}: {e}"))
+                continue
+
+        if applied_count > 0:
+            results.append((name, True, f"{name}: Applied {applied_count} icon(s)!"))
+
+            # Update library cache
+            try:
+                lib_result = self._update_library_cache(appid, icon_files)
+                if lib_result:
+                    results.append((name, True, f"{name} library icon applied!"))
+            except Exception as e:
+                results.append((name, False, f"Failed library icon for {name}: {e}"))
+
+            # Update desktop shortcuts
+            try:
+                shortcuts_count = self._update_desktop_shortcuts(applied_files, shortcuts_by_appid.get(appid, []))
+                if shortcuts_count > 0:
+                    results.append((name, True, f"{name}: Updated {shortcuts_count} desktop shortcut(s)!"))
+            except Exception as e:
+                results.append((name, False, f"Failed desktop shortcuts for {name}: {e}"))
+
+            # Desktops that couldn't be listed may hold shortcuts of this game too
+            for error in desktop_errors:
+                results.append((name, False, f"Failed desktop shortcuts for {name}: {error}"))
 
         return results
 
     def _update_library_cache(self, appid: int, icon_files: List[Path]) -> bool:
         """Update Steam library cache with JPG file only"""
-        lib_dir = self.common_path / "appcache" / "librarycache" / str(appid)
-        if not lib_dir.is_dir():
-            return False
+        lib_dir = self.library_cache_root / str(appid)
 
-        # Find existing library cache files
-        existing = [
-            fn for fn in lib_dir.iterdir()
-            if fn.suffix.lower() in (".jpg", ".jpeg")
-        ]
-        if not existing:
+        # Find the existing library cache file (usually only one)
+        existing = None
+        try:
+            with os.scandir(lib_dir) as it:
+                for entry in it:
+                    if _file_ext(entry.name) in _JPG_EXTS:
+                        existing = entry.name
+                        break
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        if existing is None:
             return False
 
         # Look for a JPG file only
         jpg_icon = None
         for icon_file in icon_files:
-            if icon_file.suffix.lower() in ('.jpg', '.jpeg'):
+            if _file_ext(icon_file.name) in _JPG_EXTS:
                 jpg_icon = icon_file
                 break
 
@@ -213,93 +446,109 @@ class IconApplier:
             # No JPG found, skip library cache update silently
             return False
 
-        # Copy the JPG file directly
+        # Copy the JPG bytes directly, no re-encoding needed
         try:
-            shutil.copy(jpg_icon, lib_dir / existing[0].name)
+            _zero_copy(jpg_icon, lib_dir / existing)
             return True
         except Exception:
             raise
 
-    def _update_desktop_shortcuts(self, appid: int, applied_files: dict) -> int:
-        """Update desktop shortcuts for the given Steam game"""
-        # Get desktop path based on platform
-        if platform.system() == "Windows":
-            desktop_path = Path.home() / "Desktop"
-            # Also check public desktop
-            public_desktop = Path(os.environ.get('PUBLIC', '')) / "Desktop"
-            desktop_paths = [desktop_path, public_desktop] if public_desktop.exists() else [desktop_path]
-            shortcut_extensions = ['.url']
+    @staticmethod
+    def _index_desktop_shortcuts() -> Tuple[Dict[int, List[Tuple[Path, str]]], List[OSError]]:
+        """
+        Read every desktop shortcut once and group them by the Steam app id they launch
+        Returns: (shortcuts by app id, errors listing the desktop folders)
+        """
+        desktop_paths = [Path.home() / "Desktop"]
+        # Also check public desktop on Windows
+        if _PUBLIC_DESKTOP is not None and _PUBLIC_DESKTOP.exists():
+            desktop_paths.append(_PUBLIC_DESKTOP)
+
+        shortcuts: Dict[int, List[Tuple[Path, str]]] = {}
+        errors: List[OSError] = []
+
+        for desktop_dir in desktop_paths:
+            if not desktop_dir.exists():
+                continue
+
+            # Scan all potential shortcut files, checking the name before touching the file
+            try:
+                with os.scandir(desktop_dir) as it:
+                    entries = list(it)
+            except OSError as e:
+                # An unreadable desktop only costs its shortcuts, never the icon copies
+                errors.append(e)
+                continue
+
+            for entry in entries:
+                if not entry.name.lower().endswith(_SHORTCUT_EXTS) or not entry.is_file():
+                    continue
+
+                shortcut_file = Path(entry.path)
+                try:
+                    if entry.stat().st_size > _MAX_SHORTCUT_SIZE:
+                        continue
+                    content = shortcut_file.read_text(encoding='utf-8', errors='ignore')
+                except OSError:
+                    # Continue indexing other shortcuts even if one can't be read
+                    continue
+
+                # Keep the already loaded content so updating needs no extra read
+                for appid in {int(m) for m in _STEAM_URL_RE.findall(content)}:
+                    shortcuts.setdefault(appid, []).append((shortcut_file, content))
+
+        return shortcuts, errors
+
+    def _update_desktop_shortcuts(self, applied_files: dict, shortcuts: List[Tuple[Path, str]]) -> int:
+        """Update the given desktop shortcuts of a Steam game"""
+        if _IS_WINDOWS:
             # Use ICO file for Windows shortcuts
             icon_path = applied_files.get('ico')
+            update_shortcut = self._update_windows_shortcut
         else:  # Linux/macOS
-            desktop_path = Path.home() / "Desktop"
-            desktop_paths = [desktop_path]
-            shortcut_extensions = ['.desktop']
             # Use JPG file for Linux shortcuts, fallback to ICO
             icon_path = applied_files.get('jpg') or applied_files.get('ico')
+            update_shortcut = self._update_linux_shortcut
 
         if not icon_path:
             # No suitable icon file was applied for shortcuts
             return 0
 
-        steam_url_patterns = [
-            f"steam://rungameid/{appid}",
-            f"steam://run/{appid}",
-            f"\"steam://rungameid/{appid}\"",
-            f"\"steam://run/{appid}\""
-        ]
-
         shortcuts_updated = 0
 
-        for desktop_dir in desktop_paths:
-            if not desktop_dir.exists():
+        for shortcut_file, content in shortcuts:
+            try:
+                shortcuts_updated += update_shortcut(shortcut_file, content, icon_path)
+            except:
+                # Continue processing other shortcuts even if one fails
                 continue
 
-            # Scan all potential shortcut files
-            for shortcut_file in desktop_dir.iterdir():
-                if not shortcut_file.is_file() or shortcut_file.suffix.lower() not in shortcut_extensions:
-                    continue
-
-                try:
-                    if platform.system() == "Windows":
-                        shortcuts_updated += self._update_windows_shortcut(shortcut_file, steam_url_patterns, icon_path)
-                    else:
-                        shortcuts_updated += self._update_linux_shortcut(shortcut_file, steam_url_patterns, icon_path)
-                except:
-                    # Continue processing other shortcuts even if one fails
-                    continue
-
         return shortcuts_updated
 
     @staticmethod
-    def _update_windows_shortcut(shortcut_file: Path, steam_patterns: list, icon_path: Path) -> int:
+    def _update_windows_shortcut(shortcut_file: Path, content: str, icon_path: Path) -> int:
         """Update Windows .url shortcut"""
         try:
             # Handle .url files (simple text format)
-            content = shortcut_file.read_text(encoding='utf-8', errors='ignore')
-
-            # Check if this shortcut points to our Steam game
-            if any(pattern in content for pattern in steam_patterns):
-                lines = content.split('\n')
-                icon_line_found = False
-
-                # Update existing IconFile line or add new one
-                for i, line in enumerate(lines):
-                    if line.startswith('IconFile='):
-                        lines[i] = f'IconFile={icon_path}'
-                        icon_line_found = True
-                        break
+            icon_line = f'IconFile={icon_path}'
+
+            # Update existing IconFile line or add new one after the URL line
+            existing = _WIN_ICON_RE.search(content)
+            if existing:
+                if existing.group(1) == str(icon_path):
+                    # Already applied, leave the file (and its mtime) untouched
+                    return 0
+                new_content = content[:existing.start()] + icon_line + content[existing.end():]
+            else:
+                # A callable replacement keeps backslashes in the path literal
+                new_content = _URL_LINE_RE.sub(lambda m: f'{m.group(0)}\n{icon_line}\nIconIndex=0', content,
+                                               count=1)
 
-                if not icon_line_found:
-                    # Add IconFile line after URL line
-                    for i, line in enumerate(lines):
-                        if line.startswith('URL='):
-                            lines.insert(i + 1, f'IconFile={icon_path}')
-                            lines.insert(i + 2, 'IconIndex=0')
-                            break
+            if new_content == content:
+                return 0
 
-                shortcut_file.write_text('\n'.join(lines), encoding='utf-8')
-                return 1
+            _write_text_atomic(shortcut_file, new_content)
+            return 1
 
         except:
             pass
@@ -307,39 +556,41 @@ class IconApplier:
         return 0
 
     @staticmethod
-    def _update_linux_shortcut(shortcut_file: Path, steam_patterns: list, icon_path: Path) -> int:
+    def _update_linux_shortcut(shortcut_file: Path, content: str, icon_path: Path) -> int:
         """Update Linux .desktop shortcut"""
         try:
-            content = shortcut_file.read_text(encoding='utf-8', errors='ignore')
-
-            # Check if this shortcut points to our Steam game
-            if any(pattern in content for pattern in steam_patterns):
-                lines = content.split('\n')
-                icon_line_found = False
-
-                # Update existing Icon line or add new one
-                for i, line in enumerate(lines):
-                    if line.startswith('Icon='):
-                        lines[i] = f'Icon={icon_path}'
-                        icon_line_found = True
-                        break
+            icon_line = f'Icon={icon_path}'
+
+            # Update existing Icon line or add new one
+            new_content = content
+            existing = _LINUX_ICON_RE.search(content)
+            if existing:
+                if existing.group(1) == str(icon_path):
+                    # Already applied, leave the file (and its mtime) untouched
+                    return 0
+                new_content = content[:existing.start()] + icon_line + content[existing.end():]
+            else:
+                # Add Icon line in the [Desktop Entry] section
+                entry = _DESKTOP_ENTRY_RE.search(content)
+                if entry:
+                    next_section = _SECTION_RE.search(content, entry.end())
+                    section_end = next_section.start() if next_section else len(content)
+
+                    # Prefer the line right after Exec=, otherwise the end of the section
+                    exec_line = _EXEC_LINE_RE.search(content, entry.end(), section_end)
+                    if exec_line:
+                        insert_pos, insert = exec_line.end(), f'\n{icon_line}'
+                    elif content[section_end - 1] == '\n':
+                        insert_pos, insert = section_end, f'{icon_line}\n'
+                    else:
+                        insert_pos, insert = section_end, f'\n{icon_line}'
+                    new_content = content[:insert_pos] + insert + content[insert_pos:]
 
-                if not icon_line_found:
-                    # Add Icon line in the [Desktop Entry] section
-                    for i, line in enumerate(lines):
-                        if line.strip() == '[Desktop Entry]':
-                            # Find a good place to insert the Icon line
-                            insert_pos = i + 1
-                            while insert_pos < len(lines) and not lines[insert_pos].startswith('['):
-                                if lines[insert_pos].startswith('Exec='):
-                                    insert_pos += 1
-                                    break
-                                insert_pos += 1
-                            lines.insert(insert_pos, f'Icon={icon_path}')
-                            break
+            if new_content == content:
+                return 0
 
-                shortcut_file.write_text('\n'.join(lines), encoding='utf-8')
-                return 1
+            _write_text_atomic(shortcut_file, new_content)
+            return 1
 
         except:
             pass
@@ -351,20 +602,36 @@ class PathManager:
     @staticmethod
     def get_default_steam_path() -> Path:
         """Get the default Steam path based on the current platform"""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             return Path(r"C:\Program Files (x86)\Steam")
-        elif platform.system() == "Linux":
+        elif _IS_LINUX:
             return Path.home() / ".local" / "share" / "Steam"
         else:
             return Path("")
 
     @staticmethod
-    def get_available_games(model: IconInstallerModel, common_path: Path) -> List[Tuple[str, int, bool]]:
-        """Get list of available games that exist in the Steam directory"""
-        allowed = set(model.get_available_games())
+    def get_available_games(model: IconInstallerModel, common_path: Path,
+                            style: Optional[int] = None) -> List[Tuple[str, int, bool]]:
+        """Get list of available games that exist in the Steam directory (for the current style by default)"""
+        allowed = model.get_available_games(style)
+
+        # List installed game folders once instead of probing every game's path
+        try:
+            with os.scandir(common_path / "steamapps" / "common") as it:
+                # normcase folds case on Windows, where folder lookups are case-insensitive
+                installed = {os.path.normcase(entry.name) for entry in it if entry.is_dir()}
+        except OSError:
+            installed = set()
+
         items = []
         for idx, (name, target_rel, _) in model.game_mapping.items():
             if idx in allowed:
+                # Mapping paths use Windows separators
+                parts = PureWindowsPath(target_rel).parts
+                if (len(parts) > 2 and parts[0].lower() == "steamapps" and parts[1].lower() == "common"
+                        and os.path.normcase(parts[2]) not in installed):
+                    continue
+
                 full_target = common_path / target_rel
                 if full_target.is_dir():
                     items.append((name, idx, False))
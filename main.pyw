@@ -1,15 +1,28 @@
+import os
 import sys
 import threading
+import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Dict, List, Set, Tuple, Union, cast
-
-from PIL import Image, ImageTk
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple, Union, cast
 
 import config
 from core import IconApplier, IconExtractor, IconInstallerModel, PathManager
 
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+# Folder holding the bundled icons and banners, resolved once at import
+_BASE_PATH = Path(__file__).resolve().parent
+
+# PyInstaller onefile builds unpack into a throwaway _MEIxxxxxx temp folder, onedir builds run in place
+_MEIPASS = getattr(sys, '_MEIPASS', None)
+_IS_ONEFILE_BUNDLE = _MEIPASS is not None and os.path.basename(_MEIPASS).startswith("_MEI")
+
+# Seconds a game scan is reused before the Steam folder is walked again
+_GAMES_CACHE_TTL = 5.0
+
 
 class IconPackInstaller:
     def __init__(self) -> None:
@@ -20,11 +33,13 @@ class IconPackInstaller:
 
         # Model and state
         self.model = IconInstallerModel()
+        self.style_options = self.build_style_options()
         self.common_path = PathManager.get_default_steam_path()
         self.selected_games: Set[int] = set()
         self.action_choice = tk.StringVar(value="install")
         self.style_choice = tk.IntVar(value=1)
         self.path_var = tk.StringVar(value=str(self.common_path))
+        self.path_var.trace_add("write", self.on_path_changed)
 
         # Initialize instance attributes
         self.full_banner: ImageTk.PhotoImage | None = None
@@ -32,6 +47,11 @@ class IconPackInstaller:
         self.path_entry: ttk.Entry | None = None
         self.game_vars: Dict[int, tk.BooleanVar] = {}
         self.current_screen: ttk.Frame | None = None
+        self.games_frame: ttk.Frame | None = None
+        self.path_refresh_job: str | None = None
+        self.games_scan_id = 0
+        self.games_cache: Dict[Tuple[Path, int, int], Tuple[float, List[Tuple[str, int, bool]]]] = {}
+        self.games_cache_lock = threading.Lock()
 
         # Load images
         self.load_images()
@@ -43,12 +63,27 @@ class IconPackInstaller:
         # Show welcome screen
         self.show_welcome_screen()
 
+    def build_style_options(self) -> List[Tuple[int, str]]:
+        """Build the (index, label) pairs shown on the style screen"""
+        options = []
+        for idx in range(1, len(self.model.styles) + 1):
+            style_name, style_desc = self.model.get_style_info(idx)
+
+            # Format the display text with description if available
+            if style_desc:
+                options.append((idx, f"{style_name}  - {style_desc}"))
+            else:
+                options.append((idx, style_name))
+        return options
+
     def load_images(self) -> None:
         """Load banner images"""
         try:
             # Load full banner
-            banner_path = Path(__file__).parent / "banner.png"
+            banner_path = _BASE_PATH / "banner.png"
             if banner_path.exists():
+                # PIL is only imported once there is an image to load
+                from PIL import Image, ImageTk
                 banner_img: Image.Image = Image.open(banner_path)
                 banner_img = banner_img.resize((200, 500), Image.Resampling.LANCZOS)
                 self.full_banner = ImageTk.PhotoImage(banner_img)
@@ -56,8 +91,9 @@ class IconPackInstaller:
                 self.full_banner = None
 
             # Load minimal banner
-            min_banner_path = Path(__file__).parent / "min_banner.png"
+            min_banner_path = _BASE_PATH / "min_banner.png"
             if min_banner_path.exists():
+                from PIL import Image, ImageTk
                 min_banner_img: Image.Image = Image.open(min_banner_path)
                 min_banner_img = min_banner_img.resize((200, 80), Image.Resampling.LANCZOS)
                 self.min_banner = ImageTk.PhotoImage(min_banner_img)
@@ -193,19 +229,11 @@ class IconPackInstaller:
         scrollbar.pack(side="right", fill="y")
 
         # Style selection with descriptions and previews
-        for idx in range(1, len(self.model.styles) + 1):
-            style_name, style_desc = self.model.get_style_info(idx)
-
+        for idx, display_text in self.style_options:
             # Create frame for this style option
             style_frame = ttk.Frame(scrollable_frame)
             style_frame.pack(fill="x", pady=10, padx=5)
 
-            # Format the display text with description if available
-            if style_desc:
-                display_text = f"{style_name}  - {style_desc}"
-            else:
-                display_text = style_name
-
             style_radio = ttk.Radiobutton(style_frame, text=display_text,
                                         variable=self.style_choice, value=idx)
             style_radio.pack(anchor="w")
@@ -236,7 +264,7 @@ class IconPackInstaller:
     def load_style_preview_icons(self, preview_frame: ttk.Frame, style_idx: int) -> None:
         """Load and display preview icons for a given style"""
         try:
-            base_path = Path(__file__).parent
+            base_path = _BASE_PATH
             style_dir = base_path / "icons" / f"style{style_idx}"
             
             if not style_dir.exists():
@@ -268,10 +296,13 @@ class IconPackInstaller:
             
             # Display preview icons
             if preview_games:
+                from PIL import Image, ImageTk
                 for i, (game_name, icon_path) in enumerate(preview_games):
                     try:
                         # Load and resize image
                         img = Image.open(icon_path)
+                        # Let the decoder scale down while decoding (JPEG), instead of full resolution
+                        img.draft('RGB', (32, 32))
                         # Resize to small preview size
                         img_resized = img.resize((32, 32), Image.Resampling.LANCZOS)
 
@@ -388,6 +419,7 @@ class IconPackInstaller:
 
         # Populate games
         self.game_vars = {}
+        self.games_frame = scrollable_frame
         self.refresh_games_list(scrollable_frame)
 
         # Buttons
@@ -412,44 +444,100 @@ class IconPackInstaller:
 
         self.game_vars.clear()
 
-        try:
-            current_path = Path(self.path_var.get())
-            items = PathManager.get_available_games(self.model, current_path)
+        loading_label = ttk.Label(parent_frame, text="Looking for games...")
+        loading_label.pack(pady=20)
 
-            if not items:
-                no_games_label = ttk.Label(parent_frame, text="No games found in the specified directory")
-                no_games_label.pack(pady=20)
-                return
+        # Scan in background so slow or network drives don't freeze the window
+        self.games_scan_id += 1
+        scan_id = self.games_scan_id
+        current_path = Path(self.path_var.get())
 
-            # Add individual games
-            for name, idx, _ in items:
-                var = tk.BooleanVar(value=True)
-                self.game_vars[idx] = var
-                cb = ttk.Checkbutton(parent_frame, text=name, variable=var)
-                cb.pack(anchor="w", pady=2)
+        style = self.model.current_style
 
-        except Exception as e:
-            error_label = ttk.Label(parent_frame, text=f"Error loading games: {e}")
+        def scan_worker() -> None:
+            try:
+                items = self.get_cached_games(current_path, style)
+                self.root.after(0, self.populate_games_list, parent_frame, scan_id, items, None)
+            except Exception as e:
+                self.root.after(0, self.populate_games_list, parent_frame, scan_id, [], e)
+
+        thread = threading.Thread(target=scan_worker, daemon=True)
+        thread.start()
+
+    def get_cached_games(self, common_path: Path, style: int) -> List[Tuple[str, int, bool]]:
+        """Return the game scan for a path and style, reusing a recent scan when nothing changed"""
+        try:
+            mtime = (common_path / "steamapps" / "common").stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+
+        key = (common_path, style, mtime)
+        with self.games_cache_lock:
+            cached = self.games_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _GAMES_CACHE_TTL:
+            return cached[1]
+
+        # Scan for the captured style, which may no longer be the model's current one
+        items = PathManager.get_available_games(self.model, common_path, style)
+
+        # Overlapping scans run on separate worker threads
+        with self.games_cache_lock:
+            now = time.monotonic()
+            # Drop expired entries so the cache never outlives a session's worth of paths
+            self.games_cache = {k: v for k, v in self.games_cache.items() if now - v[0] < _GAMES_CACHE_TTL}
+            self.games_cache[key] = (now, items)
+        return items
+
+    def populate_games_list(self, parent_frame: ttk.Frame, scan_id: int,
+                            items: List[Tuple[str, int, bool]], error: Exception | None) -> None:
+        """Show the scanned games, unless a newer scan has been started since"""
+        if scan_id != self.games_scan_id or not parent_frame.winfo_exists():
+            return
+
+        for widget in parent_frame.winfo_children():
+            widget.destroy()
+
+        if error is not None:
+            error_label = ttk.Label(parent_frame, text=f"Error loading games: {error}")
             error_label.pack(pady=20)
+            return
+
+        if not items:
+            no_games_label = ttk.Label(parent_frame, text="No games found in the specified directory")
+            no_games_label.pack(pady=20)
+            return
+
+        # Add individual games
+        for name, idx, _ in items:
+            var = tk.BooleanVar(value=True)
+            self.game_vars[idx] = var
+            cb = ttk.Checkbutton(parent_frame, text=name, variable=var)
+            cb.pack(anchor="w", pady=2)
 
     def browse_folder(self) -> None:
         """Browse for Steam folder"""
         folder = filedialog.askdirectory(initialdir=self.path_var.get())
         if folder:
             self.path_var.set(folder)
-            self.common_path = Path(folder)
-            # Refresh games list
-            # Find the scrollable frame and refresh
-            if self.current_screen is not None:
-                for child in self.current_screen.winfo_children():
-                    if isinstance(child, ttk.Frame):
-                        for subchild in child.winfo_children():
-                            if isinstance(subchild, tk.Canvas):
-                                canvas_children = subchild.winfo_children()
-                                if canvas_children and isinstance(canvas_children[0], ttk.Frame):
-                                    scrollable_frame = cast(ttk.Frame, canvas_children[0])
-                                    self.refresh_games_list(scrollable_frame)
-                                    break
+            # A picked folder is final, so refresh right away instead of waiting
+            self.apply_path()
+
+    def on_path_changed(self, *_args: Any) -> None:
+        """Refresh the games list once the path has stopped changing for a moment"""
+        # Every keystroke would otherwise rescan the Steam folder
+        if self.path_refresh_job is not None:
+            self.root.after_cancel(self.path_refresh_job)
+        self.path_refresh_job = self.root.after(300, self.apply_path)
+
+    def apply_path(self) -> None:
+        """Use the entered path as Steam folder and refresh the games list"""
+        if self.path_refresh_job is not None:
+            self.root.after_cancel(self.path_refresh_job)
+            self.path_refresh_job = None
+
+        self.common_path = Path(self.path_var.get())
+        if self.games_frame is not None and self.games_frame.winfo_exists():
+            self.refresh_games_list(self.games_frame)
 
     def show_exit_screen(self, message: str = "Installation completed successfully!") -> None:
         """Show exit screen"""
@@ -541,17 +629,22 @@ class IconPackInstaller:
     def extract_icons(self) -> None:
         """Extract icons to current directory"""
         try:
-            base_path = Path(__file__).parent
-            destination = Path.cwd()
-
-            # Check if destination already exists
-            if (destination / "icons").exists():
-                result = messagebox.askyesno("Overwrite",
-                                             "Icons folder already exists. Overwrite?")
+            base_path = _BASE_PATH
+            cwd = os.getcwd()
+            destination = Path(cwd)
+
+            # Check if destination already exists (lexists also catches a dangling symlink)
+            if os.path.lexists(os.path.join(cwd, "icons")):
+                result = messagebox.askyesno("Update",
+                                             "Icons folder already exists. Update it?\n"
+                                             "Bundled icons are refreshed; other files in the folder are kept.")
                 if not result:
                     return
 
-            success, message, file_count = IconExtractor.extract_icons(base_path, destination)
+            # Extracted icons must be independent, editable copies. Linking is only safe for a
+            # onefile bundle, whose unpacked files are deleted on exit, and only within one filesystem.
+            hardlink = _IS_ONEFILE_BUNDLE and os.stat(base_path).st_dev == os.stat(destination).st_dev
+            success, message, file_count = IconExtractor.extract_icons(base_path, destination, hardlink=hardlink)
 
             if success:
                 self.show_exit_screen(f"Icons extracted successfully!\n{file_count} files extracted.")
@@ -568,7 +661,7 @@ class IconPackInstaller:
 
         def install_worker() -> None:
             try:
-                base_path = Path(__file__).parent
+                base_path = _BASE_PATH
                 applier = IconApplier(self.model, base_path, self.common_path)
 
                 results = applier.apply_icons_to_games(selected_games)